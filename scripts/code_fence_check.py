@@ -27,7 +27,7 @@ pre-merge check for documentation PRs. It complements other checks such as the
 internal link checker and emoji scan.
 
 Usage:
-    python3 scripts/code_fence_check.py [--docs-root PATH] [--extensions .md,.markdown] [--verbose]
+    python3 scripts/code_fence_check.py [--docs-root PATH] [--extensions .md,.markdown] [--max-bytes N] [--verbose]
 
 By default, it scans "../docs" relative to this script.
 """
@@ -35,23 +35,145 @@ By default, it scans "../docs" relative to this script.
 from __future__ import annotations
 
 import argparse
+import functools
 import os
-import re
 import sys
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
-# Regex to detect a fence line and capture
-#  - group 1: fence characters (e.g., ``` or ~~~)
-#  - group 2: the rest of the line after the fence
-_FENCE_RE = re.compile(r"^\s*([`~]{3,})(.*)$")
+from docs_walk import DEFAULT_MAX_BYTES, decode_doc_text, iter_doc_files, read_doc_bytes, scan_files
+
+_FENCE_CHARS = "`~"
+
+
+def _iter_fence_lines(text: str) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Yield `(line_start, fence_start, fence_end, line_end)` for every line whose
+    first non-whitespace characters are a fence (three or more backticks or
+    tildes, e.g. ``` or ~~~).
+
+    Instead of visiting every line, this jumps between occurrences of "```" and
+    "~~~" with `str.find` and only then checks that the run starts the line, so
+    ordinary prose is skipped at C speed.
+    """
+    find = text.find
+    end = len(text)
+    next_backticks = find("```")
+    next_tildes = find("~~~")
+    while next_backticks >= 0 or next_tildes >= 0:
+        if next_tildes < 0 or 0 <= next_backticks < next_tildes:
+            hit = next_backticks
+        else:
+            hit = next_tildes
+
+        line_start = text.rfind("\n", 0, hit) + 1
+        line_end = find("\n", hit)
+        if line_end < 0:
+            line_end = end
+
+        # Extend the hit to the full run of fence characters around it
+        fence_start = hit
+        while fence_start > line_start and text[fence_start - 1] in _FENCE_CHARS:
+            fence_start -= 1
+        fence_end = hit + 3
+        while fence_end < line_end and text[fence_end] in _FENCE_CHARS:
+            fence_end += 1
+
+        # Only whitespace may precede the fence on its line
+        if fence_start == line_start or text[line_start:fence_start].isspace():
+            yield line_start, fence_start, fence_end, line_end
+
+        # Continue on the next line
+        if line_end == end:
+            return
+        if 0 <= next_backticks <= line_end:
+            next_backticks = find("```", line_end + 1)
+        if 0 <= next_tildes <= line_end:
+            next_tildes = find("~~~", line_end + 1)
+
+
+def _scan_one(path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> Tuple[str, List[Tuple[int, str]]]:
+    """
+    Scan a single file for fenced code block openings without a language tag.
+
+    Returns `(path, [(line_number, line_text), ...])`.
+    """
+    issues: List[Tuple[int, str]] = []
+    try:
+        raw = read_doc_bytes(path, max_bytes)
+        if raw is None:
+            issues.append((0, f"<file larger than {max_bytes} bytes; skipped>"))
+            return path, issues
+        text = decode_doc_text(raw)
+    except UnicodeDecodeError:
+        issues.append((0, "<binary-or-non-utf8-file>"))
+        return path, issues
+    except Exception as e:
+        issues.append((0, f"<error reading file: {e}>"))
+        return path, issues
+    return path, check_fences(text)
+
+
+def check_fences(text: str) -> List[Tuple[int, str]]:
+    """
+    Check the fenced code blocks in the contents of one Markdown file.
+
+    Returns `[(line_number, line_text), ...]` for opening fences without a
+    language/path tag, plus an entry for an unclosed block.
+    """
+    issues: List[Tuple[int, str]] = []
+    in_block = False
+    block_fence_char = ""
+    block_fence_seq = ""
+    block_open_line = 0
+
+    # Only fence lines are visited; line numbers are advanced by counting the
+    # newlines skipped since the previous fence.
+    lineno = 1
+    pos = 0
+    for line_start, fence_start, fence_end, line_end in _iter_fence_lines(text):
+        lineno += text.count("\n", pos, line_start)
+        pos = line_start
+        fence_seq = text[fence_start:fence_end]
+        fence_char = fence_seq[0]  # '`' or '~'
+
+        if not in_block:
+            # Opening fence
+            # If the rest is empty, it's a violation (missing language)
+            rest = text[fence_end:line_end]
+            if not rest or rest.isspace():
+                issues.append((lineno, text[line_start:line_end]))
+            # Enter code block (even if language missing) to maintain state
+            in_block = True
+            block_fence_char = fence_char
+            block_fence_seq = fence_seq
+            block_open_line = lineno
+        else:
+            # Potential closing fence: verify it's the same fence character
+            # (we don't require the same length of the fence sequence)
+            if fence_char == block_fence_char:
+                in_block = False
+                block_fence_char = ""
+                block_fence_seq = ""
+                block_open_line = 0
+            # else: another fence-like line inside a block that uses a different char;
+            # treat it as literal content (no state change)
+    # After file ends, check for unclosed block
+    if in_block:
+        # Report as a distinct issue (use line number of the opening fence)
+        msg = f"<unclosed code block opened at line {block_open_line}>"
+        issues.append((block_open_line, msg))
+    return issues
 
 
 def find_missing_language_tags(
-    docs_root: str, extensions: Tuple[str, ...] = (".md",)
+    docs_root: str,
+    extensions: Tuple[str, ...] = (".md",),
+    max_bytes: int = DEFAULT_MAX_BYTES,
 ) -> Dict[str, List[Tuple[int, str]]]:
     """
     Scan files under `docs_root` for fenced code block openings that do not
-    include a language/path tag.
+    include a language/path tag. Files larger than `max_bytes` are skipped and
+    reported with a warning.
 
     Returns a mapping:
         { filepath: [ (line_number, line_text), ... ] }
@@ -61,59 +183,10 @@ def find_missing_language_tags(
     if not os.path.isdir(docs_root):
         raise FileNotFoundError(f"docs root not found: {docs_root}")
 
-    for dirpath, _, filenames in os.walk(docs_root):
-        for fname in filenames:
-            lower = fname.lower()
-            if not any(lower.endswith(ext) for ext in extensions):
-                continue
-
-            path = os.path.join(dirpath, fname)
-            try:
-                with open(path, "r", encoding="utf-8") as fh:
-                    in_block = False
-                    block_fence_char = ""
-                    block_fence_seq = ""
-                    block_open_line = 0
-
-                    for lineno, line in enumerate(fh, start=1):
-                        m = _FENCE_RE.match(line)
-                        if m:
-                            fence_seq = m.group(1)
-                            fence_char = fence_seq[0]  # '`' or '~'
-                            rest = m.group(2).strip()
-
-                            if not in_block:
-                                # Opening fence
-                                # If the rest is empty, it's a violation (missing language)
-                                if rest == "":
-                                    results.setdefault(path, []).append(
-                                        (lineno, line.rstrip("\n"))
-                                    )
-                                # Enter code block (even if language missing) to maintain state
-                                in_block = True
-                                block_fence_char = fence_char
-                                block_fence_seq = fence_seq
-                                block_open_line = lineno
-                            else:
-                                # Potential closing fence: verify it's the same fence character
-                                # (we don't require the same length of the fence sequence)
-                                if fence_char == block_fence_char:
-                                    in_block = False
-                                    block_fence_char = ""
-                                    block_fence_seq = ""
-                                    block_open_line = 0
-                                # else: another fence-like line inside a block that uses a different char;
-                                # treat it as literal content (no state change)
-                        # plain line -> continue scanning
-                    # After file ends, check for unclosed block
-                    if in_block:
-                        # Report as a distinct issue (use line number of the opening fence)
-                        msg = f"<unclosed code block opened at line {block_open_line}>"
-                        results.setdefault(path, []).append((block_open_line, msg))
-            except UnicodeDecodeError:
-                results.setdefault(path, []).append((0, "<binary-or-non-utf8-file>"))
-            except Exception as e:
-                results.setdefault(path, []).append((0, f"<error reading file: {e}>"))
+    paths = iter_doc_files(docs_root, extensions)
+    for path, issues in scan_files(functools.partial(_scan_one, max_bytes=max_bytes), paths):
+        if issues:
+            results[path] = issues
     return results
 
 
@@ -126,7 +199,9 @@ def print_report(found: Dict[str, List[Tuple[int, str]]], verbose: bool = False)
     total_issues = sum(len(v) for v in found.values())
     print(f"Code-fence language check: {total_issues} issue(s) across {total_files} file(s).")
     print()
-    for path, occurrences in sorted(found.items()):
+    # Paths are unique, so sorting just the keys is enough
+    for path in sorted(found) if len(found) > 1 else found:
+        occurrences = found[path]
         print(f"{path}:")
         for lineno, snippet in occurrences:
             if lineno == 0:
@@ -148,6 +223,12 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
         default=".md",
         help="Comma-separated file extensions to scan (default: .md). Example: .md,.markdown",
     )
+    p.add_argument(
+        "--max-bytes",
+        type=int,
+        default=DEFAULT_MAX_BYTES,
+        help=f"Skip (and warn about) files larger than this many bytes (default: {DEFAULT_MAX_BYTES})",
+    )
     p.add_argument("--verbose", "-v", action="store_true", help="Show helpful hints and context for violations")
     return p.parse_args(argv)
 
@@ -157,7 +238,7 @@ def main(argv: List[str]) -> int:
     exts = tuple(e.strip().lower() for e in args.extensions.split(",") if e.strip())
 
     try:
-        found = find_missing_language_tags(args.docs_root, exts)
+        found = find_missing_language_tags(args.docs_root, exts, max_bytes=args.max_bytes)
     except FileNotFoundError as e:
         print(f"ERROR: {e}", file=sys.stderr)
         return 2
@@ -13,22 +13,56 @@ Small, conservative internal Markdown link checker for the `docs/` directory.
 
 Limitations:
 - Does not validate internal anchors (e.g. `file.md#some-heading`) vs actual headers.
-- The link parsing is a heuristic using regex and will not cover every Markdown edge-case.
+- The link parsing is a heuristic (a plain `str.find` scan for `[text](target)`) and will
+  not cover every Markdown edge-case.
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
 import os
-import re
 import sys
-from typing import List, Tuple
+from typing import Iterator, List, Optional, Tuple
 
-LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+from docs_walk import iter_doc_files, scan_files
 
 EXTERNAL_SCHEMES = ("http://", "https://", "mailto:", "tel:", "ftp://", "data:")
 
 
+def iter_links(text: str) -> Iterator[Tuple[str, str]]:
+    r"""
+    Yield `(link_text, target)` for every Markdown link of the form `[text](target)`.
+
+    Equivalent to matching `\[([^\]]+)\]\(([^)]+)\)` left to right, except that
+    an escaped bracket (`\[`) never starts a link. Scanning with `str.find` keeps
+    the work in C and avoids allocating match objects for non-links.
+    """
+    pos = 0
+    while True:
+        lb = text.find("[", pos)
+        if lb < 0:
+            return
+        rb = text.find("]", lb + 1)
+        if rb < 0:
+            # No closing bracket anywhere after this point, so no more links
+            return
+        escaped = lb > 0 and text[lb - 1] == "\\"
+        if escaped or rb == lb + 1 or not text.startswith("(", rb + 1):
+            # Not a link start: retry from the next opening bracket
+            pos = lb + 1
+            continue
+        rp = text.find(")", rb + 2)
+        if rp < 0:
+            return
+        if rp == rb + 2:
+            # Empty target: not a link
+            pos = lb + 1
+            continue
+        yield text[lb + 1 : rb], text[rb + 2 : rp]
+        pos = rp + 1
+
+
 def is_external_link(target: str) -> bool:
     t = target.strip().lower()
     return t.startswith(EXTERNAL_SCHEMES)
@@ -43,9 +77,48 @@ def normalize_target_path(target: str) -> str:
     return target
 
 
+@functools.lru_cache(maxsize=None)
+def _is_dir(path: str) -> bool:
+    # Many links point into the same directories; probe each one only once per
+    # scan (the cache is reset by clear_caches())
+    return os.path.isdir(path)
+
+
+def clear_caches() -> None:
+    """
+    Forget cached filesystem lookups so the next scan sees the current tree.
+
+    Called at the start of every scan, so files and directories created or
+    removed between two scans in the same process are picked up.
+    """
+    _is_dir.cache_clear()
+    _path_exists.cache_clear()
+    _unresolved_link_path.cache_clear()
+
+
+def _join_target(base: str, target: str) -> str:
+    """
+    Join `target` onto the already-normalized `base`. `os.path.normpath` is only
+    applied when it could change the result: '.'/'..' segments, empty segments,
+    a trailing or missing path part, or a platform with non-'/' separators.
+    """
+    path = os.path.join(base, target)
+    if (
+        os.sep != "/"
+        or not target
+        or target.startswith(".")
+        or "/." in target
+        or "//" in target
+        or target.endswith("/")
+    ):
+        return os.path.normpath(path)
+    return path
+
+
 def resolve_candidate(src_dir: str, target: str, repo_docs_root: str) -> List[str]:
     """
     Return a list of candidate filesystem paths to check for existence.
+    `src_dir` and `repo_docs_root` are expected to be normalized paths.
 
     We try a few heuristics:
     - relative path (from src_dir)
@@ -67,16 +140,16 @@ def resolve_candidate(src_dir: str, target: str, repo_docs_root: str) -> List[st
 
     # Absolute-style: treat leading slash as repo root (i.e., path relative to repo)
     if t.startswith("/"):
-        candidate = os.path.normpath(os.path.join(os.path.dirname(repo_docs_root), t.lstrip("/")))
+        candidate = _join_target(os.path.dirname(repo_docs_root), t.lstrip("/"))
         candidates.append(candidate)
     else:
         # relative to source file
-        candidate = os.path.normpath(os.path.join(src_dir, t))
+        candidate = _join_target(src_dir, t)
         candidates.append(candidate)
 
     # If the target is a directory (or looks like one), try README.md inside it
     for c in list(candidates):
-        if os.path.isdir(c):
+        if _is_dir(c):
             candidates.append(os.path.join(c, "README.md"))
 
     # If no extension provided, attempt to add .md (and .yaml, .json for some references)
@@ -91,6 +164,65 @@ def resolve_candidate(src_dir: str, target: str, repo_docs_root: str) -> List[st
     return candidates
 
 
+@functools.lru_cache(maxsize=None)
+def _path_exists(path: str) -> bool:
+    return os.path.exists(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _unresolved_link_path(src_dir: str, target: str, repo_docs_root: str) -> Optional[str]:
+    """
+    Return None if `target` (linked from `src_dir`) resolves to an existing
+    path, otherwise the path to report as broken.
+
+    Results are cached: many files link to the same targets (e.g. `index.md`,
+    `../README.md`), so each (source directory, target) pair and each candidate
+    path is only checked against the filesystem once per scan (see
+    `clear_caches`).
+    """
+    # Resolve candidate paths
+    candidates = resolve_candidate(src_dir, target, repo_docs_root)
+    for cand in candidates:
+        if _path_exists(cand):
+            return None
+    # Use the first candidate as the resolved path for reporting
+    return candidates[0] if candidates else target
+
+
+def _scan_one(full_path: str, docs_root: str) -> List[Tuple[str, str, str, str]]:
+    """
+    Return the broken links found in a single Markdown file, in the same
+    tuple format as `find_broken_links`.
+    """
+    with open(full_path, "r", encoding="utf-8") as fh:
+        try:
+            text = fh.read()
+        except Exception as e:
+            print(f"WARN: Could not read {full_path}: {e}", file=sys.stderr)
+            return []
+    return check_links(full_path, text, docs_root)
+
+
+def check_links(full_path: str, text: str, docs_root: str) -> List[Tuple[str, str, str, str]]:
+    """
+    Return the broken links in `text`, the contents of the Markdown file at
+    `full_path`, in the same tuple format as `find_broken_links`.
+    """
+    broken = []
+    dirpath = os.path.dirname(full_path)
+    for link_text, target in iter_links(text):
+        target = target.strip()
+        # Skip external links and anchors
+        if is_external_link(target) or target.startswith("#"):
+            continue
+
+        resolved_path = _unresolved_link_path(dirpath, target, docs_root)
+        if resolved_path is not None:
+            broken.append((full_path, link_text, target, resolved_path))
+
+    return broken
+
+
 def find_broken_links(docs_root: str) -> List[Tuple[str, str, str, str]]:
     """
     Returns list of tuples: (source_file, link_text, link_target, resolved_candidate)
@@ -98,45 +230,27 @@ def find_broken_links(docs_root: str) -> List[Tuple[str, str, str, str]]:
     """
     broken = []
     docs_root = os.path.normpath(docs_root)
+    clear_caches()
 
-    for dirpath, dirnames, filenames in os.walk(docs_root):
-        for name in filenames:
-            if not name.endswith(".md"):
-                continue
-            full_path = os.path.join(dirpath, name)
-            rel_src = os.path.relpath(full_path, docs_root)
-            with open(full_path, "r", encoding="utf-8") as fh:
-                try:
-                    text = fh.read()
-                except Exception as e:
-                    print(f"WARN: Could not read {full_path}: {e}", file=sys.stderr)
-                    continue
-
-            for m in LINK_RE.finditer(text):
-                link_text = m.group(1)
-                target = m.group(2).strip()
-                # Skip external links and anchors
-                if is_external_link(target) or target.startswith("#"):
-                    continue
-
-                # Resolve candidate paths
-                candidates = resolve_candidate(dirpath, target, docs_root)
-                exists = False
-                resolved_existing = ""
-                for cand in candidates:
-                    if os.path.exists(cand):
-                        exists = True
-                        resolved_existing = cand
-                        break
-
-                if not exists:
-                    # Use the first candidate as the resolved path for reporting
-                    resolved_path = candidates[0] if candidates else target
-                    broken.append((full_path, link_text, target, resolved_path))
+    # Extension matching in iter_doc_files is case-insensitive; only `.md` is checked here
+    paths = (p for p in iter_doc_files(docs_root, (".md",)) if p.endswith(".md"))
+    for file_broken in scan_files(functools.partial(_scan_one, docs_root=docs_root), paths):
+        broken.extend(file_broken)
 
     return broken
 
 
+def print_report(broken: List[Tuple[str, str, str, str]]) -> None:
+    if not broken:
+        print("No broken internal links found (checked docs/).")
+        return
+
+    print("Broken links found:")
+    for src, text, target, resolved in broken:
+        print(f"- {src}: [{text}]({target}) -> {resolved}")
+    print(f"\nTotal broken links: {len(broken)}")
+
+
 def main(argv: List[str]) -> int:
     p = argparse.ArgumentParser(description="Simple internal Markdown link checker for docs/")
     p.add_argument(
@@ -157,15 +271,8 @@ def main(argv: List[str]) -> int:
         print(f"Checking Markdown links under: {docs_root}")
 
     broken = find_broken_links(docs_root)
-    if broken:
-        print("Broken links found:")
-        for src, text, target, resolved in broken:
-            print(f"- {src}: [{text}]({target}) -> {resolved}")
-        print(f"\nTotal broken links: {len(broken)}")
-        return 1
-
-    print("No broken internal links found (checked docs/).")
-    return 0
+    print_report(broken)
+    return 1 if broken else 0
 
 
 if __name__ == "__main__":
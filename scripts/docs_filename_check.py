@@ -24,12 +24,15 @@ and `emoji_check.py`.
 from __future__ import annotations
 
 import argparse
+import functools
 import os
 import re
 import sys
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from docs_walk import iter_doc_files
+
 # Pattern to validate markdown basenames (except README.md)
 MD_BASENAME_RE = re.compile(r"^[a-z0-9_]+\.md$")
 
@@ -55,27 +58,55 @@ def check_path_component_case(component: str) -> bool:
     """
     Returns True if the path component contains uppercase letters.
     """
+    if component.isascii():
+        # Single C-level pass; exact for ASCII, where only A-Z change under lower()
+        return component != component.lower()
     return any(ch.isupper() for ch in component)
 
 
-def analyze_file(path: Path, docs_root: Path) -> List[str]:
+@functools.lru_cache(maxsize=None)
+def _dir_issues(rel_dir: str) -> Tuple[str, ...]:
+    """
+    Return the issues for the directory components of `rel_dir` (relative to
+    the docs root). Cached because every file in a directory shares them.
+    """
+    if not rel_dir:
+        return ()
+    return tuple(
+        f"directory contains uppercase characters: '{comp}'"
+        for comp in rel_dir.split(os.sep)
+        if check_path_component_case(comp)
+    )
+
+
+def _split_suffix(name: str) -> str:
+    """
+    Return the extension of `name` including the leading dot (e.g. '.md'),
+    following the same rules as `pathlib.PurePath.suffix`.
+    """
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        return name[dot:]
+    return ""
+
+
+def analyze_file(path: str, docs_root: str) -> List[str]:
     """
     Analyze a single file and return a list of issues detected for this file.
+
+    `path` must be located under `docs_root`; both are plain strings so the
+    whole scan runs on `str` operations without allocating `Path` objects.
     """
-    issues: List[str] = []
-    rel = path.relative_to(docs_root)
-    rel_str = str(rel)
+    rel_dir, _, name = path[len(os.path.join(docs_root, "")) :].rpartition(os.sep)
 
     # Check directory components for uppercase characters (not allowed)
-    for comp in rel.parts[:-1]:  # directories only
-        if check_path_component_case(comp):
-            issues.append(f"directory contains uppercase characters: '{comp}'")
+    issues: List[str] = list(_dir_issues(rel_dir))
 
-    name = path.name
-    suffix = path.suffix  # includes leading dot, e.g., '.md'
+    suffix = _split_suffix(name)  # includes leading dot, e.g., '.md'
+    suffix_lower = suffix.lower()
 
     # Markdown checks
-    if suffix.lower() == MD_EXT:
+    if suffix_lower == MD_EXT:
         # Enforce lowercase extension
         if suffix != MD_EXT:
             issues.append(f"extension must be lowercase '{MD_EXT}' (found '{suffix}')")
@@ -91,7 +122,7 @@ def analyze_file(path: Path, docs_root: Path) -> List[str]:
                 issues.append("filename contains spaces; use underscores instead")
             if "-" in name:
                 issues.append("filename contains hyphen(s); use underscores instead")
-            if any(ch.isupper() for ch in name):
+            if check_path_component_case(name):
                 issues.append("filename contains uppercase letters; use lowercase only")
             # If none of the above matched, give a generic message
             if not any(
@@ -106,12 +137,12 @@ def analyze_file(path: Path, docs_root: Path) -> List[str]:
                 )
 
     # YAML checks: reject `.yml` in favor of `.yaml`
-    elif suffix.lower() == YML_EXT:
+    elif suffix_lower == YML_EXT:
         issues.append(
             "YAML files must use the '.yaml' extension (rename from .yml → .yaml)"
         )
 
-    elif suffix.lower() == YAML_EXT:
+    elif suffix_lower == YAML_EXT:
         # Enforce lowercase `.yaml` (rare edge-case where extension case mismatched)
         if suffix != YAML_EXT:
             issues.append(f"extension must be lowercase '{YAML_EXT}' (found '{suffix}')")
@@ -121,43 +152,48 @@ def analyze_file(path: Path, docs_root: Path) -> List[str]:
     return issues
 
 
-def find_violations(docs_root: Path, verbose: bool = False) -> Dict[Path, List[str]]:
+def check_file(path: str, docs_root: str, verbose: bool = False) -> List[str]:
+    """
+    Return the issues to report for a single file under `docs_root`.
+    """
+    # We only validate markdown/yaml conventions; ignore other file types except to
+    # check path casings (directories will be checked per-file as we iterate files).
+    suffix = _split_suffix(os.path.basename(path)).lower()
+    if suffix not in (MD_EXT, YML_EXT, YAML_EXT):
+        # Still detect uppercase directories via analyze_file (it will check dir parts),
+        # but only report them for other file types in verbose mode
+        return analyze_file(path, docs_root) if verbose else []
+
+    return analyze_file(path, docs_root)
+
+
+def find_violations(docs_root: str, verbose: bool = False) -> Dict[str, List[str]]:
     """
     Walk docs_root and collect filename violations.
     """
-    if not docs_root.exists() or not docs_root.is_dir():
+    docs_root = os.path.normpath(os.fspath(docs_root))
+    if not os.path.isdir(docs_root):
         raise FileNotFoundError(f"docs root not found: {docs_root}")
 
-    violations: Dict[Path, List[str]] = {}
-
-    for p in docs_root.rglob("*"):
-        if not p.is_file():
-            continue
-        # We only validate markdown/yaml conventions; ignore other file types except to
-        # check path casings (directories will be checked per-file as we iterate files).
-        suffix = p.suffix.lower()
-        if suffix not in (MD_EXT, YML_EXT, YAML_EXT):
-            # Still detect uppercase directories via analyze_file (it will check dir parts)
-            issues = analyze_file(p, docs_root)
-            if issues and verbose:
-                violations[p] = issues
-            continue
-
-        issues = analyze_file(p, docs_root)
+    violations: Dict[str, List[str]] = {}
+
+    for path in iter_doc_files(docs_root, extensions=None):
+        issues = check_file(path, docs_root, verbose=verbose)
         if issues:
-            violations[p] = issues
+            violations[path] = issues
 
     return violations
 
 
-def print_report(violations: Dict[Path, List[str]]) -> None:
+def print_report(violations: Dict[str, List[str]]) -> None:
     if not violations:
         print("Docs filename check: OK — no filename or extension issues found.")
         return
 
     total = len(violations)
     print(f"Docs filename check: {total} file(s) with issues:\n")
-    for path, issues in sorted(violations.items(), key=lambda kv: str(kv[0])):
+    for path in sorted(violations) if len(violations) > 1 else violations:
+        issues = violations[path]
         print(f"- {path}:")
         for msg in issues:
             print(f"    - {msg}")
@@ -190,7 +226,7 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
 def main(argv: List[str]) -> int:
     args = parse_args(argv)
     try:
-        docs_root = Path(find_docs_root(args.docs_root)).resolve()
+        docs_root = str(Path(find_docs_root(args.docs_root)).resolve())
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
         return 2
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+docs_lint.py
+
+Run all documentation validation checks in a single pass over `docs/`:
+
+- internal link check (`doc_link_check.py`)
+- emoji scan (`emoji_check.py`)
+- fenced code block language check (`code_fence_check.py`)
+- filename and extension check (`docs_filename_check.py`)
+
+Running the four scripts one after another walks the docs tree four times and
+reads most files three times. This driver walks the tree once and reads every
+Markdown file once, running the three content checks on the same text. Content
+checks run in a pool of worker processes. The filename checks need no file
+contents, so the main process runs them while the workers are busy. Each
+report uses the same format as its standalone script.
+
+Usage:
+    python3 scripts/docs_lint.py [--docs-root PATH] [--include-archive] [--strict] [--max-bytes N] [--verbose]
+
+Options mirror the standalone scripts: `--include-archive` and `--strict` apply
+to the emoji scan, `--verbose` adds context to the emoji and code-fence reports
+and includes non-Markdown files in the directory-case check. `--max-bytes`
+applies to the emoji and code-fence checks only; like `doc_link_check.py`, the
+link check reads files of any size.
+
+Exit codes:
+    0 - all checks passed
+    1 - one or more checks reported issues
+    2 - fatal error (e.g., docs root not found)
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import code_fence_check
+import doc_link_check
+import docs_filename_check
+import emoji_check
+from docs_walk import ARCHIVE_DIR, DEFAULT_MAX_BYTES, decode_doc_text, iter_doc_files, read_doc_bytes
+
+# Files handed to a worker process at a time; smaller trees are checked in-process
+# because starting the pool would cost more than it saves.
+_CHUNKSIZE = 64
+
+FenceIssues = List[Tuple[int, str]]
+BrokenLinks = List[Tuple[str, str, str, str]]
+EmojiIssues = List[Tuple[int, str, str]]
+
+
+def _check_oversized_links(path: str, docs_root: str) -> Tuple[BrokenLinks, Optional[str]]:
+    """
+    Run the link check on a file that exceeds `--max-bytes`. The standalone link
+    checker has no size cap, so the whole file is read for it.
+
+    Returns `(broken_links, warning)`.
+    """
+    if not path.endswith(".md"):
+        return [], None
+    try:
+        with open(path, "rb") as fh:
+            text = decode_doc_text(fh.read())
+    except (OSError, UnicodeDecodeError) as e:
+        return [], f"WARN: Could not read {path}: {e}"
+    return doc_link_check.check_links(path, text, docs_root), None
+
+
+def _lint_one(
+    path: str,
+    check_emoji: bool,
+    docs_root: str,
+    strict: bool = False,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    verbose: bool = False,
+) -> Tuple[str, FenceIssues, BrokenLinks, EmojiIssues, Optional[str]]:
+    """
+    Read one Markdown file and run the content checks on it.
+
+    Returns `(path, fence_issues, broken_links, emoji_issues, warning)`, where
+    `warning` is a message for stderr when the link check could not read the file.
+    Emoji line context is only collected when `verbose` is set.
+    """
+    try:
+        raw = read_doc_bytes(path, max_bytes)
+    except OSError as e:
+        return path, [(0, f"<error reading file: {e}>")], [], [], f"WARN: Could not read {path}: {e}"
+    if raw is None:
+        msg = f"<file larger than {max_bytes} bytes; skipped>"
+        links, warning = _check_oversized_links(path, docs_root)
+        return path, [(0, msg)], links, [(0, "", msg)] if check_emoji else [], warning
+    # The emoji scan works on the raw bytes, so it runs even if decoding fails
+    emoji = emoji_check.scan_file_contents(raw, strict=strict, with_context=verbose) if check_emoji else []
+    try:
+        text = decode_doc_text(raw)
+    except UnicodeDecodeError as e:
+        return path, [(0, "<binary-or-non-utf8-file>")], [], emoji, f"WARN: Could not read {path}: {e}"
+
+    fences = code_fence_check.check_fences(text)
+    # The link checker only looks at files with an exact, lowercase `.md` extension
+    links = doc_link_check.check_links(path, text, docs_root) if path.endswith(".md") else []
+    return path, fences, links, emoji, None
+
+
+def lint_docs(
+    docs_root: str,
+    include_archive: bool = False,
+    strict: bool = False,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    verbose: bool = False,
+) -> Tuple[Dict[str, EmojiIssues], Dict[str, FenceIssues], BrokenLinks, Dict[str, List[str]]]:
+    """
+    Run every check over `docs_root`.
+
+    Returns `(emoji_found, fence_found, broken_links, filename_violations)` in the
+    formats produced by the individual scripts.
+    """
+    docs_root = os.path.abspath(docs_root)
+    if not os.path.isdir(docs_root):
+        raise FileNotFoundError(f"docs root not found: {docs_root}")
+    # Cleared before the worker pool starts, so forked workers begin empty as well
+    doc_link_check.clear_caches()
+
+    all_files = list(iter_doc_files(docs_root, extensions=None))
+    md_files = [p for p in all_files if p.lower().endswith(".md")]
+    archive_prefix = os.path.join(docs_root, ARCHIVE_DIR, "")
+    check_emoji = [include_archive or not p.startswith(archive_prefix) for p in md_files]
+    lint_one = functools.partial(_lint_one, docs_root=docs_root, strict=strict, max_bytes=max_bytes, verbose=verbose)
+
+    emoji_found: Dict[str, EmojiIssues] = {}
+    fence_found: Dict[str, FenceIssues] = {}
+    broken: BrokenLinks = []
+    violations: Dict[str, List[str]] = {}
+
+    executor = ProcessPoolExecutor() if len(md_files) > _CHUNKSIZE else None
+    try:
+        if executor is not None:
+            results = executor.map(lint_one, md_files, check_emoji, chunksize=_CHUNKSIZE)
+        else:
+            results = map(lint_one, md_files, check_emoji)
+
+        # Filename checks need no file contents; run them while the workers read files
+        for path in all_files:
+            issues = docs_filename_check.check_file(path, docs_root, verbose=verbose)
+            if issues:
+                violations[path] = issues
+
+        for path, fences, links, emoji, warning in results:
+            if warning:
+                print(warning, file=sys.stderr)
+            if fences:
+                fence_found[path] = fences
+            if emoji:
+                emoji_found[path] = emoji
+            broken.extend(links)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return emoji_found, fence_found, broken, violations
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Run all docs/ validation checks in a single pass.")
+    default_docs = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "docs"))
+    p.add_argument("--docs-root", default=default_docs, help=f"Path to the docs/ directory (default: {default_docs})")
+    p.add_argument("--include-archive", action="store_true", help="Include files under docs/archive/ in the emoji scan (defaults to False)")
+    p.add_argument("--strict", action="store_true", help="Use legacy strict emoji detection (includes dingbats and technical ranges)")
+    p.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES, help=f"Skip (and warn about) files larger than this many bytes in the emoji and code-fence checks (default: {DEFAULT_MAX_BYTES})")
+    p.add_argument("--verbose", "-v", action="store_true", help="Show context and hints for reported issues")
+    return p.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+
+    if args.verbose:
+        print(f"Checking docs under: {os.path.abspath(args.docs_root)}")
+
+    try:
+        emoji_found, fence_found, broken, violations = lint_docs(
+            args.docs_root,
+            include_archive=args.include_archive,
+            strict=args.strict,
+            max_bytes=args.max_bytes,
+            verbose=args.verbose,
+        )
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+    doc_link_check.print_report(broken)
+    print()
+    emoji_check.print_report(emoji_found, verbose=args.verbose)
+    print()
+    code_fence_check.print_report(fence_found, verbose=args.verbose)
+    print()
+    docs_filename_check.print_report(violations)
+
+    return 1 if (emoji_found or fence_found or broken or violations) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
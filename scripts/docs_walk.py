@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+docs_walk.py
+
+Shared traversal helpers for the documentation validation scripts
+(`doc_link_check.py`, `emoji_check.py`, `code_fence_check.py`, and
+`docs_filename_check.py`).
+
+- `iter_doc_files` walks a directory tree with `os.scandir` (reusing the file
+  type reported by the directory read instead of issuing an extra `stat` per
+  entry) and yields matching file paths in the same order as `os.walk`.
+- `scan_files` applies a per-file scan function across a pool of threads.
+  The scans are dominated by file open/read latency, so overlapping them gives
+  a near-linear speedup; results are yielded in input order so reports stay
+  deterministic, and only a bounded number of scans run ahead of the consumer.
+- `read_doc_bytes` / `decode_doc_text` read a file with an upper size bound
+  and decode it the same way text-mode `open()` would. `open_doc_bytes`
+  memory-maps large files instead of copying them into a bytes object.
+
+This module is not meant to be run directly.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import mmap
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, Iterable, Iterator, Optional, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+
+# The scans are I/O-bound, so oversubscribe the CPUs.
+MAX_WORKERS = (os.cpu_count() or 1) * 4
+
+# Most per-file scans that scan_files() runs ahead of the consumer. Finished
+# results wait in memory until they are consumed, so this bounds how much file
+# content can be held at once.
+MAX_PENDING = MAX_WORKERS * 2
+
+ARCHIVE_DIR = "archive"
+
+# Directories that never hold documentation (tool caches, vendored packages)
+# and are not descended into. Hidden directories are skipped as well.
+SKIP_DIRS = frozenset({"node_modules", "_build", "venv", "__pycache__"})
+
+# Files larger than this are not scanned (e.g. accidentally committed attachments).
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+# Files at least this large are memory-mapped by open_doc_bytes().
+MMAP_THRESHOLD = 1024 * 1024
+
+# Memory maps are checked for non-ASCII bytes in slices of this size, so the
+# vectorized bytes.isascii() can be used without copying the whole map.
+_ASCII_CHUNK_BYTES = 64 * 1024
+
+DocBytes = Union[bytes, mmap.mmap]
+
+
+def iter_doc_files(
+    root: str,
+    extensions: Optional[Tuple[str, ...]] = (".md",),
+    include_archive: bool = True,
+) -> Iterator[str]:
+    """
+    Yield paths of files under `root` whose lowercased name ends with one of
+    `extensions`. Pass `extensions=None` to yield every file.
+
+    Files in a directory are yielded before descending into its subdirectories
+    (top-down, like `os.walk`). Symlinked directories, hidden directories and
+    `SKIP_DIRS` are not descended into. If `include_archive` is False, the
+    top-level `archive/` directory is skipped.
+    """
+    subdirs = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith(".") and entry.name not in SKIP_DIRS:
+                    subdirs.append(entry.path)
+            elif entry.is_file() and (
+                extensions is None or entry.name.lower().endswith(extensions)
+            ):
+                yield entry.path
+
+    for path in subdirs:
+        if not include_archive and os.path.basename(path) == ARCHIVE_DIR:
+            continue
+        yield from iter_doc_files(path, extensions)
+
+
+def scan_files(scan_one: Callable[[str], T], paths: Iterable[str]) -> Iterator[T]:
+    """
+    Apply `scan_one` to every path using a thread pool and yield the results
+    in the same order as `paths`.
+
+    At most `MAX_PENDING` scans are submitted ahead of the result being
+    consumed, so `paths` is read lazily and unconsumed results cannot pile up.
+    Exceptions raised by `scan_one` are re-raised in the caller when the
+    corresponding result is reached.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        pending: Deque[Future[T]] = collections.deque()
+        for path in paths:
+            if len(pending) >= MAX_PENDING:
+                yield pending.popleft().result()
+            pending.append(executor.submit(scan_one, path))
+        while pending:
+            yield pending.popleft().result()
+
+
+def read_doc_bytes(path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> Optional[bytes]:
+    """
+    Return the raw contents of `path`, or None if it is larger than `max_bytes`.
+
+    At most `max_bytes + 1` bytes are read, so oversized files cost no more than
+    the limit.
+    """
+    with open(path, "rb") as fh:
+        raw = fh.read(max_bytes + 1)
+    if len(raw) > max_bytes:
+        return None
+    return raw
+
+
+@contextlib.contextmanager
+def open_doc_bytes(path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> Iterator[Optional[DocBytes]]:
+    """
+    Yield the contents of `path`, or None if it is larger than `max_bytes`.
+
+    Files of at least `MMAP_THRESHOLD` bytes are yielded as a read-only memory
+    map (valid only inside the `with` block), so the OS pages in just what is
+    scanned and no full copy is made; smaller files are read into `bytes`.
+    """
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if size > max_bytes:
+            yield None
+        elif size < MMAP_THRESHOLD:
+            yield fh.read()
+        else:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+
+def is_ascii(data: DocBytes) -> bool:
+    """Return True if `data` (bytes or a memory map) contains only ASCII bytes."""
+    if isinstance(data, bytes):
+        return data.isascii()
+    return all(
+        data[start : start + _ASCII_CHUNK_BYTES].isascii()
+        for start in range(0, len(data), _ASCII_CHUNK_BYTES)
+    )
+
+
+def decode_doc_text(raw: bytes) -> str:
+    r"""
+    Decode `raw` as UTF-8 and translate `\r\n` / `\r` line endings to `\n`,
+    matching `open(path, "r", encoding="utf-8")`.
+
+    Raises UnicodeDecodeError if `raw` is not valid UTF-8.
+    """
+    text = raw.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
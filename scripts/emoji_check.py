@@ -5,7 +5,7 @@ emoji_check.py
 Small helper script to scan Markdown documentation for emoji characters.
 
 Usage:
-    python3 emoji_check.py [--docs-root PATH] [--include-archive] [--verbose] [--strict]
+    python3 emoji_check.py [--docs-root PATH] [--include-archive] [--max-bytes N] [--verbose] [--strict]
 
 By default the scanner uses a relaxed emoji range (avoids flagging box-drawing and check marks).
 Set `--strict` to use the legacy, broader ranges.
@@ -29,65 +29,329 @@ Notes:
   AGENTS.md to retain its visual markers if necessary while keeping the
   rest of the documentation emoji-free.
 - By default the script also skips `docs/archive/` (historical implementation notes and logs). Use `--include-archive` to include archived files in the scan.
+- Files larger than `--max-bytes` (default 4 MiB) are not scanned and are reported
+  with a warning instead.
+- Files are matched as raw bytes and never decoded as a whole, so files that
+  are not valid UTF-8 are still scanned.
+- If the optional `google-re2` package is installed, it is used for the scan;
+  results are the same, only faster.
 """
 
 from __future__ import annotations
 
 import argparse
+import bisect
+import functools
 import os
 import re
 import sys
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Pattern, Tuple
 
-# Two patterns are provided:
+try:
+    # Optional: google-re2 (`pip install google-re2`) runs the bytes patterns as a
+    # DFA, which is much faster than `re` on large trees. `re` is used otherwise.
+    import re2
+except ImportError:
+    re2 = None
+
+from docs_walk import DEFAULT_MAX_BYTES, is_ascii, iter_doc_files, open_doc_bytes, scan_files
+
+# Two range sets are provided:
 #  - RELAXED (default): captures common emoji/pictograph ranges but avoids
 #    dingbats/technical ranges that commonly include box-drawing characters,
 #    check marks, and similar glyphs used for formatting.
 #  - STRICT (legacy): the original, broader set of ranges (use --strict to opt in).
-_EMOJI_RE_RELAXED = re.compile(
-    "["  # relaxed: common emoji/pictograph ranges only
-    "\U0001F300-\U0001F5FF"  # symbols & pictographs
-    "\U0001F600-\U0001F64F"  # emoticons
-    "\U0001F680-\U0001F6FF"  # transport & map
-    "\U0001F1E0-\U0001F1FF"  # flags
-    "\U0001F900-\U0001F9FF"  # supplemental symbols & pictographs
-    "\U0001FA70-\U0001FAFF"  # Symbols & Pictographs Extended-A
-    "]+",
-    flags=re.UNICODE,
+_RELAXED_RANGES = (
+    (0x1F300, 0x1F5FF),  # symbols & pictographs
+    (0x1F600, 0x1F64F),  # emoticons
+    (0x1F680, 0x1F6FF),  # transport & map
+    (0x1F1E0, 0x1F1FF),  # flags
+    (0x1F900, 0x1F9FF),  # supplemental symbols & pictographs
+    (0x1FA70, 0x1FAFF),  # Symbols & Pictographs Extended-A
 )
 
-# Legacy, broader pattern (matches the previous behavior)
-_EMOJI_RE_STRICT = re.compile(
-    "["  # begin char class
-    "\U0001F300-\U0001F5FF"  # symbols & pictographs
-    "\U0001F600-\U0001F64F"  # emoticons
-    "\U0001F680-\U0001F6FF"  # transport & map
-    "\U0001F1E0-\U0001F1FF"  # flags
-    "\U00002702-\U000027B0"  # dingbats
-    "\U000024C2-\U0001F251"
-    "\U0001F900-\U0001F9FF"  # supplemental symbols & pictographs
-    "\U0001FA70-\U0001FAFF"  # Symbols & Pictographs Extended-A
-    "\U00002600-\U000026FF"  # Misc symbols
-    "\U00002300-\U000023FF"  # Misc technical
-    "]+",
-    flags=re.UNICODE,
+# Legacy, broader ranges (matches the previous behavior)
+_STRICT_RANGES = (
+    (0x1F300, 0x1F5FF),  # symbols & pictographs
+    (0x1F600, 0x1F64F),  # emoticons
+    (0x1F680, 0x1F6FF),  # transport & map
+    (0x1F1E0, 0x1F1FF),  # flags
+    (0x02702, 0x027B0),  # dingbats
+    (0x024C2, 0x1F251),
+    (0x1F900, 0x1F9FF),  # supplemental symbols & pictographs
+    (0x1FA70, 0x1FAFF),  # Symbols & Pictographs Extended-A
+    (0x02600, 0x026FF),  # Misc symbols
+    (0x02300, 0x023FF),  # Misc technical
 )
 
 
-def find_emoji_in_text(text: str, strict: bool = False) -> List[Tuple[int, str]]:
+def _utf8_sequences(lo: int, hi: int) -> Iterator[List[Tuple[int, int]]]:
+    """
+    Yield byte-range sequences whose union is exactly the UTF-8 encodings of
+    the code points `lo..hi` (surrogates excluded, as they never appear in
+    valid UTF-8). Each sequence is a list of inclusive `(low_byte, high_byte)`
+    pairs, one per encoded byte.
+    """
+    if lo <= 0xDFFF and hi >= 0xD800:
+        if lo < 0xD800:
+            yield from _utf8_sequences(lo, 0xD7FF)
+        if hi > 0xDFFF:
+            yield from _utf8_sequences(0xE000, hi)
+        return
+    # Split where the encoded length changes
+    for bound in (0x7F, 0x7FF, 0xFFFF):
+        if lo <= bound < hi:
+            yield from _utf8_sequences(lo, bound)
+            yield from _utf8_sequences(bound + 1, hi)
+            return
+    # Split until every continuation byte after the first differing one spans
+    # its full range, so the byte ranges can be combined independently
+    length = len(chr(lo).encode("utf-8"))
+    for i in range(1, length):
+        mask = (1 << (6 * i)) - 1
+        if lo & ~mask != hi & ~mask:
+            if lo & mask:
+                yield from _utf8_sequences(lo, lo | mask)
+                yield from _utf8_sequences((lo | mask) + 1, hi)
+                return
+            if hi & mask != mask:
+                yield from _utf8_sequences(lo, (hi & ~mask) - 1)
+                yield from _utf8_sequences(hi & ~mask, hi)
+                return
+    yield list(zip(chr(lo).encode("utf-8"), chr(hi).encode("utf-8")))
+
+
+def _compile_bytes(pattern: bytes, probe: bytes) -> Pattern[bytes]:
+    """
+    Compile a bytes pattern with google-re2 when it is installed, else with `re`.
+
+    The re2 pattern is only used if it finds exactly the same matches as the
+    `re` pattern in `probe`; any other module named `re2` (e.g. the older pyre2
+    package, which has no `Options`) or a mismatch falls back to `re`.
+    """
+    compiled = re.compile(pattern)
+    if re2 is None:
+        return compiled
+    try:
+        options = re2.Options()
+        # Treat the subject as raw bytes; in the default UTF-8 mode the byte
+        # classes would be read as code points and never match
+        options.encoding = re2.Options.Encoding.LATIN1
+        fast = re2.compile(pattern, options=options)
+        same = [(m.start(), m.group(0)) for m in fast.finditer(probe)] == [
+            (m.start(), m.group(0)) for m in compiled.finditer(probe)
+        ]
+    except Exception:
+        # An incompatible re2 module must never stop the scan
+        return compiled
+    return fast if same else compiled
+
+
+def _byte_class(lo: int, hi: int) -> bytes:
+    return b"\\x%02x" % lo if lo == hi else b"[\\x%02x-\\x%02x]" % (lo, hi)
+
+
+def _compile_patterns(ranges: Tuple[Tuple[int, int], ...]) -> Tuple[Pattern[str], Pattern[bytes]]:
+    """
+    Compile `ranges` into a str pattern and an equivalent bytes pattern that
+    matches the same runs in UTF-8 encoded data without decoding it.
+
+    The bytes alternatives are grouped by their lead byte, and the first
+    character of a run is spelled out ahead of the repetition. That lets the
+    regex engine scan for a possible lead byte in C (cheap check) and try the
+    full alternation (expensive check) only at those offsets.
+    """
+    text_class = "".join(f"{chr(lo)}-{chr(hi)}" for lo, hi in ranges)
+    by_lead: Dict[Tuple[int, int], List[bytes]] = {}
+    for lo, hi in ranges:
+        for seq in _utf8_sequences(lo, hi):
+            by_lead.setdefault(seq[0], []).append(b"".join(_byte_class(a, b) for a, b in seq[1:]))
+    char = b"|".join(_byte_class(*lead) + b"(?:" + b"|".join(tails) + b")" for lead, tails in by_lead.items())
+    # Sample text for checking an alternative regex engine: the code points at
+    # and just outside every range boundary, runs of them, and invalid UTF-8
+    probe = b"x".join(
+        "".join(chr(cp) for cp in (lo - 1, lo, lo, hi, hi + 1) if not 0xD800 <= cp <= 0xDFFF).encode("utf-8")
+        for lo, hi in ranges
+    ) + b"\xff\xf0\x9f\x98\xf0\x9f\x98\x80\x80\n"
+    return (
+        re.compile(f"[{text_class}]+"),
+        _compile_bytes(b"(?:" + char + b")(?:" + char + b")*", probe),
+    )
+
+
+_EMOJI_RE_RELAXED, _EMOJI_BYTES_RE_RELAXED = _compile_patterns(_RELAXED_RANGES)
+_EMOJI_RE_STRICT, _EMOJI_BYTES_RE_STRICT = _compile_patterns(_STRICT_RANGES)
+
+# Bytes pattern used to scan raw file contents for each str pattern
+_BYTES_PATTERNS = {
+    _EMOJI_RE_RELAXED: _EMOJI_BYTES_RE_RELAXED,
+    _EMOJI_RE_STRICT: _EMOJI_BYTES_RE_STRICT,
+}
+
+# Every code point in the relaxed ranges is >= U+1F1E0, so it is encoded in
+# UTF-8 as a 4-byte sequence starting with 0xF0. A file without that byte cannot
+# match the relaxed pattern. The strict pattern also covers 3-byte BMP ranges
+# and has no such single-byte marker.
+_LEAD_BYTES = {_EMOJI_RE_RELAXED: b"\xf0"}
+
+# Pattern used when no explicit mode is requested; switch it with set_strict().
+_ACTIVE_EMOJI_RE = _EMOJI_RE_RELAXED
+
+
+def set_strict(strict: bool = True) -> None:
+    """
+    Select the pattern used by `find_emoji_in_text` and `scan_docs_for_emoji`
+    when they are called without an explicit `strict` argument.
+    """
+    global _ACTIVE_EMOJI_RE
+    _ACTIVE_EMOJI_RE = _EMOJI_RE_STRICT if strict else _EMOJI_RE_RELAXED
+
+
+def _resolve_pattern(strict: Optional[bool]) -> Pattern[str]:
+    if strict is None:
+        return _ACTIVE_EMOJI_RE
+    return _EMOJI_RE_STRICT if strict else _EMOJI_RE_RELAXED
+
+
+def find_emoji_in_text(text: str, strict: Optional[bool] = None) -> List[Tuple[int, str]]:
     """
     Return a list of (index, match_text) for emoji-like matches in `text`.
     Index is the Python string index (character offset).
 
     If `strict` is True, the legacy broader pattern is used (includes dingbats
-    and technical symbol ranges). By default (strict=False) a relaxed pattern
-    is used to avoid flagging box-drawing and check marks.
+    and technical symbol ranges). If False, a relaxed pattern is used to avoid
+    flagging box-drawing and check marks. If omitted, the mode selected with
+    `set_strict` applies (relaxed unless changed).
     """
-    pattern = _EMOJI_RE_STRICT if strict else _EMOJI_RE_RELAXED
+    # Every emoji is non-ASCII, so ASCII-only text cannot match
+    if text.isascii():
+        return []
+    pattern = _resolve_pattern(strict)
     return [(m.start(), m.group(0)) for m in pattern.finditer(text)]
 
 
-def scan_docs_for_emoji(docs_root: str, extensions: Tuple[str, ...] = (".md",), include_archive: bool = False, strict: bool = False) -> Dict[str, List[Tuple[int, str, str]]]:
+# Contents of the files that need a regex pass are joined with this separator
+# and scanned in one call. It is not part of any emoji encoding, so no match can
+# span two files.
+_CORPUS_SEPARATOR = b"\x00"
+# Upper bound on the joined contents per regex call. Together with the bounded
+# read-ahead of scan_files() (MAX_PENDING files of at most `max_bytes` each),
+# this bounds the file contents held in memory at once.
+_MAX_CORPUS_BYTES = 64 * 1024 * 1024
+
+
+def _normalize_newlines(raw: bytes) -> bytes:
+    r"""Translate `\r\n` / `\r` line endings to `\n`, like text-mode `open()`."""
+    if b"\r" in raw:
+        raw = raw.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return raw
+
+
+def _load_one(
+    path: str, max_bytes: int = DEFAULT_MAX_BYTES, lead_byte: Optional[bytes] = None
+) -> Tuple[str, Optional[bytes], List[Tuple[int, str, str]]]:
+    """
+    Read a single file for scanning.
+
+    Returns `(path, raw, warnings)`. `raw` is None when the file needs no regex
+    pass: it is pure ASCII (every emoji is non-ASCII, so this is the common fast
+    path), it lacks `lead_byte` (when given), or it is too large. The last case
+    produces a warning entry in the same format as the scan results.
+    """
+    with open_doc_bytes(path, max_bytes) as data:
+        if data is None:
+            return path, None, [(0, "", f"<file larger than {max_bytes} bytes; skipped>")]
+        if is_ascii(data) or (lead_byte is not None and data.find(lead_byte) < 0):
+            return path, None, []
+        # Only files that may match are copied out of a memory map
+        return path, _normalize_newlines(data[:]), []
+
+
+def _needs_regex(raw: bytes, lead_byte: Optional[bytes]) -> bool:
+    """
+    Return False if the raw file contents cannot contain a match: they are pure
+    ASCII, or `lead_byte` (when given) does not occur in them.
+    """
+    return not raw.isascii() and (lead_byte is None or lead_byte in raw)
+
+
+def _scan_corpus(
+    contents: List[bytes], pattern: Pattern[str], with_context: bool = True
+) -> Dict[int, List[Tuple[int, str, str]]]:
+    """
+    Run the bytes form of `pattern` once over all `contents` joined together and
+    map every match back to its file, line number and line text.
+
+    The contents are never decoded as a whole; only the matched bytes and the
+    lines they occur on are decoded for the report. If `with_context` is False
+    the line text is left empty and the lines are not decoded at all.
+
+    Returns `{ index_in_contents: [ (line_number, matched_characters, line_text), ... ] }`
+    for the files that contain matches.
+    """
+    results: Dict[int, List[Tuple[int, str, str]]] = {}
+    starts: List[int] = []
+    offset = 0
+    for raw in contents:
+        starts.append(offset)
+        offset += len(raw) + len(_CORPUS_SEPARATOR)
+    corpus = _CORPUS_SEPARATOR.join(contents)
+
+    issues: List[Tuple[int, str, str]] = []
+    file_start = file_end = line_end = 0
+    lineno = pos = 0
+    for m in _BYTES_PATTERNS[pattern].finditer(corpus):
+        start = m.start()
+        # The pattern only matches complete UTF-8 sequences
+        matched = m.group(0).decode("utf-8")
+        if start >= file_end:
+            # First match in a new file
+            idx = bisect.bisect_right(starts, start) - 1
+            file_start = starts[idx]
+            file_end = file_start + len(contents[idx])
+            issues = results[idx] = []
+            lineno = 1
+            pos = file_start
+        elif start < line_end:
+            # Same line as the previous match: concatenate all matched emoji
+            # sequences on the line for reporting
+            _, previous, context = issues[-1]
+            issues[-1] = (lineno, previous + matched, context)
+            continue
+        # Line numbers are advanced by counting the newlines since the previous
+        # match in C. (str.splitlines() is not used for a line table: it also
+        # splits on \v, \f, \x1c-\x1e, \x85 and \u2028/\u2029, which would
+        # disagree with the '\n'-only lines reported everywhere else.)
+        lineno += corpus.count(b"\n", pos, start)
+        pos = start
+        line_end = corpus.find(b"\n", start, file_end)
+        if line_end < 0:
+            line_end = file_end
+        if not with_context:
+            issues.append((lineno, matched, ""))
+            continue
+        line_start = corpus.rfind(b"\n", file_start, start)
+        line_start = file_start if line_start < 0 else line_start + 1
+        # The rest of the line may hold bytes that are not valid UTF-8
+        issues.append((lineno, matched, corpus[line_start:line_end].decode("utf-8", "replace")))
+    return results
+
+
+def scan_file_contents(raw: bytes, strict: Optional[bool] = None, with_context: bool = True) -> List[Tuple[int, str, str]]:
+    """
+    Scan the raw contents of one file and return
+    `[ (line_number, matched_characters, line_text), ... ]`.
+
+    The same fast paths and `with_context` option as `scan_docs_for_emoji`
+    apply, and the contents do not need to be valid UTF-8.
+    """
+    pattern = _resolve_pattern(strict)
+    if not _needs_regex(raw, _LEAD_BYTES.get(pattern)):
+        return []
+    return _scan_corpus([_normalize_newlines(raw)], pattern, with_context).get(0, [])
+
+
+def scan_docs_for_emoji(docs_root: str, extensions: Tuple[str, ...] = (".md",), include_archive: bool = False, strict: Optional[bool] = None, max_bytes: int = DEFAULT_MAX_BYTES, with_context: bool = True) -> Dict[str, List[Tuple[int, str, str]]]:
     """
     Scan files under `docs_root` for emoji characters.
 
@@ -96,36 +360,44 @@ def scan_docs_for_emoji(docs_root: str, extensions: Tuple[str, ...] = (".md",),
 
     Args:
         strict: If True, use the legacy, broader emoji ranges (same as --strict).
+            If omitted, the mode selected with `set_strict` applies.
+        max_bytes: Files larger than this are skipped and reported with a warning.
+        with_context: If False, `line_text` is left empty for matches (it is only
+            shown in verbose reports), which saves extracting every matching line.
     """
-    results: Dict[str, List[Tuple[int, str, str]]] = {}
+    found: Dict[str, List[Tuple[int, str, str]]] = {}
 
     docs_root = os.path.abspath(docs_root)
     if not os.path.isdir(docs_root):
         raise FileNotFoundError(f"docs root not found: {docs_root}")
 
-    for dirpath, _, filenames in os.walk(docs_root):
-        # Optionally skip archived documentation to avoid noisy historical artifacts
-        rel_dir = os.path.relpath(dirpath, docs_root)
-        if not include_archive and (rel_dir == "archive" or rel_dir.startswith("archive" + os.sep)):
+    pattern = _resolve_pattern(strict)
+    order: List[str] = []
+    batch_paths: List[str] = []
+    batch_contents: List[bytes] = []
+    batch_bytes = 0
+
+    # Optionally skip archived documentation to avoid noisy historical artifacts
+    paths = iter_doc_files(docs_root, extensions, include_archive=include_archive)
+    for path, raw, warnings in scan_files(functools.partial(_load_one, max_bytes=max_bytes, lead_byte=_LEAD_BYTES.get(pattern)), paths):
+        order.append(path)
+        if warnings:
+            found[path] = warnings
+        if raw is None:
             continue
+        batch_paths.append(path)
+        batch_contents.append(raw)
+        batch_bytes += len(raw)
+        if batch_bytes >= _MAX_CORPUS_BYTES:
+            for idx, issues in _scan_corpus(batch_contents, pattern, with_context).items():
+                found[batch_paths[idx]] = issues
+            batch_paths, batch_contents, batch_bytes = [], [], 0
+    if batch_contents:
+        for idx, issues in _scan_corpus(batch_contents, pattern, with_context).items():
+            found[batch_paths[idx]] = issues
 
-        for fname in filenames:
-            if not fname.lower().endswith(extensions):
-                continue
-            path = os.path.join(dirpath, fname)
-            try:
-                with open(path, "r", encoding="utf-8") as fh:
-                    for i, line in enumerate(fh, start=1):
-                        matches = find_emoji_in_text(line, strict=strict)
-                        if matches:
-                            # Concatenate all matched emoji sequences on the line for reporting
-                            matched_texts = [m[1] for m in matches]
-                            results.setdefault(path, []).append((i, "".join(matched_texts), line.rstrip("\n")))
-            except UnicodeDecodeError:
-                # Could not decode the file as UTF-8; warn and skip
-                results.setdefault(path, []).append((0, "", "<binary-or-non-utf8-file>"))
-
-    return results
+    # Report files in traversal order
+    return {path: found[path] for path in order if path in found}
 
 
 def print_report(found: Dict[str, List[Tuple[int, str, str]]], verbose: bool = False) -> None:
@@ -137,11 +409,12 @@ def print_report(found: Dict[str, List[Tuple[int, str, str]]], verbose: bool = F
     total_occurrences = sum(len(v) for v in found.values())
     print(f"Emoji characters detected: {total_occurrences} occurrence(s) across {total_files} file(s).")
     print()
-    for path, occurrences in sorted(found.items()):
+    for path in sorted(found) if len(found) > 1 else found:
+        occurrences = found[path]
         print(f"{path}:")
         for lineno, match, context in occurrences:
-            if lineno == 0 and context == "<binary-or-non-utf8-file>":
-                print(f"  [warning] Could not read file as UTF-8 which prevents emoji scanning.")
+            if lineno == 0:
+                print(f"  [warning] {context}")
             else:
                 # Show the matched characters in a readable form (unicode codepoints)
                 codepoints = " ".join(f"U+{ord(ch):04X}" for ch in match)
@@ -157,6 +430,7 @@ def parse_args(argv: List[str]) -> argparse.Namespace:
     p.add_argument("--docs-root", default=default_docs, help=f"Path to docs/ directory (default: {default_docs})")
     p.add_argument("--extensions", default=".md", help="Comma-separated file extensions to scan (default: .md)")
     p.add_argument("--include-archive", action="store_true", help="Include files under docs/archive/ in the scan (defaults to False)")
+    p.add_argument("--max-bytes", type=int, default=DEFAULT_MAX_BYTES, help=f"Skip (and warn about) files larger than this many bytes (default: {DEFAULT_MAX_BYTES})")
     p.add_argument("--strict", action="store_true", help="Use legacy strict emoji detection (includes dingbats and technical ranges). Default: relaxed detection to avoid flagging box-drawing and check marks.")
     p.add_argument("--verbose", "-v", action="store_true", help="Show matching line context for each occurrence")
     return p.parse_args(argv)
@@ -167,6 +441,8 @@ def main(argv: List[str]) -> int:
     docs_root = args.docs_root
     exts = tuple(e.strip().lower() for e in args.extensions.split(",") if e.strip())
 
+    set_strict(args.strict)
+
     if args.verbose:
         if args.strict:
             print("Using strict emoji detection (--strict): legacy broad ranges enabled.")
@@ -174,7 +450,7 @@ def main(argv: List[str]) -> int:
             print("Using relaxed emoji detection (default): avoids flagging box-drawing and check marks.")
 
     try:
-        found = scan_docs_for_emoji(docs_root, exts, include_archive=args.include_archive, strict=args.strict)
+        found = scan_docs_for_emoji(docs_root, exts, include_archive=args.include_archive, max_bytes=args.max_bytes, with_context=args.verbose)
     except FileNotFoundError as e:
         print(f"ERROR: {e}", file=sys.stderr)
         return 2